@@ -7,9 +7,11 @@
 который служит контейнером для всего интерфейса приложения.
 """
 
+import threading
+import time
 import tkinter as tk
 from tkinter import colorchooser, filedialog, messagebox, simpledialog
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageColor, ImageDraw, ImageTk
 
 
 class DrawingApp:
@@ -33,23 +35,51 @@ class DrawingApp:
 
         self.width = 600
         self.height = 400
-        self.image = Image.new("RGB", (self.width, self.height), "white")
+        # Изображение хранится в режиме "P" (палитра, 1 байт на пиксель вместо 3):
+        # набор цветов в рисовалке ограничен, а память под буфер сокращается втрое.
+        # Палитра наращивается по мере выбора новых цветов (см. _color_index)
+        self.image = Image.new("P", (self.width, self.height), 0)
+        self._init_palette("white")
         self.draw = ImageDraw.Draw(self.image)
+        self._refresh_pixel_access()
 
         self.canvas = tk.Canvas(root, width=self.width, height=self.height, bg='white')
         self.canvas.pack()
 
+        # Текущий цвет фона холста: позволяет _reset_buffer не дергать canvas.config,
+        # когда ни размеры, ни фон фактически не изменились
+        self._canvas_bg = 'white'
+
+        # Постоянный PhotoImage-буфер холста: создается один раз под размер изображения
+        # и далее обновляется на месте через photo.paste без переаллокаций (см. update_canvas)
+        self.photo = ImageTk.PhotoImage(self.image)
+        self._photo_item = self.canvas.create_image(0, 0, image=self.photo, anchor=tk.NW)
+
+        # Ссылки на PhotoImage-фрагменты частичных обновлений холста (см. update_canvas)
+        self._photo_patches = []
+
         # Начальный цвет кисти
         self.pen_color = 'black'
 
         self.last_x, self.last_y = None, None
 
+        # Буфер координат текущего штриха (плоский список x0, y0, x1, y1, ...):
+        # события <B1-Motion> накапливаются здесь, рисование выполняется одним пакетом
+        # в методе _flush_stroke, после чего буфер очищается на месте и переиспользуется
+        self._pending_pts = []
+        self._flush_scheduled = False
+
+        # Время приема последней точки штриха: используется в paint для прореживания
+        # событий от мышей с высокой частотой опроса (см. докстринг paint)
+        self._last_paint_t = 0.0
+
         # Хранение предыдущего цвета кисти
         self.previous_color = self.pen_color
 
         # Установка начального размера кисти
         self.brush_size = 1
 
+        self.canvas.bind('<ButtonPress-1>', self._start_stroke)
         self.canvas.bind('<B1-Motion>', self.paint)
         self.canvas.bind('<ButtonRelease-1>', self.reset)
 
@@ -63,6 +93,9 @@ class DrawingApp:
 
         self.setup_ui()
 
+        # Инициализация кэша разобранного цвета кисти (self._pen_rgb) через единый сеттер
+        self._set_pen(self.pen_color)
+
     def setup_ui(self):
         """
         Этот метод отвечает за создание и расположение виджетов управления.
@@ -114,6 +147,105 @@ class DrawingApp:
         self.color_preview = tk.Label(control_frame, width=2, height=1, bg=self.pen_color)
         self.color_preview.pack(side=tk.LEFT, padx=5)
 
+    def _refresh_pixel_access(self):
+        """
+        Кэширует объект прямого доступа к пикселям изображения (Image.load).
+        getpixel заново создает такой объект при каждом вызове - это документированный медленный путь Pillow.
+        Кэш нужно обновлять после каждого пересоздания self.image.
+        """
+        self._px = self.image.load()
+
+    def _reset_buffer(self, w, h, bg):
+        """
+        Пересоздает холст и буфер рисования с заданными размерами и цветом фона.
+        Единая точка для clear_canvas, change_background_color и change_canvas_size:
+        раньше каждый из них сам создавал Image и ImageDraw (а change_canvas_size делал это дважды,
+        вызывая в конце clear_canvas). Здесь изображение, объект рисования, кэш доступа к пикселям
+        и настройка виджета Canvas выполняются ровно по одному разу, причем canvas.config
+        (а с ним и событие <Configure> с переукладкой) вызывается одним атомарным обращением
+        и только если размеры или фон действительно изменились.
+        """
+        reconfigure = (w, h) != (self.width, self.height) or bg != self._canvas_bg
+        self.width, self.height = w, h
+        self.image = Image.new("P", (w, h), 0)
+        self._init_palette(bg)
+        self.draw = ImageDraw.Draw(self.image)
+        self._refresh_pixel_access()
+        # Палитра новая, поэтому индекс текущего цвета кисти нужно выделить заново
+        self._pen_index = self._color_index(self._pen_rgb)
+        self.canvas.delete("all")
+        self._photo_patches = []
+        if reconfigure:
+            self.canvas.config(width=w, height=h, bg=bg)
+            self._canvas_bg = bg
+        self.photo = ImageTk.PhotoImage(self.image)
+        self._photo_item = self.canvas.create_image(0, 0, image=self.photo, anchor=tk.NW)
+
+    def _pixel_at(self, x, y):
+        """
+        Возвращает кортеж (r, g, b) пикселя по координатам.
+        Чтение идет через кэшированный объект self._px - одна индексация на уровне C,
+        без повторного создания объекта доступа и без промежуточных структур Python.
+        Для палитрового изображения пиксель хранит индекс, который разворачивается
+        в цвет по списку self._pal_colors.
+        """
+        return self._pal_colors[self._px[x, y]]
+
+    def _init_palette(self, bg):
+        """
+        Инициализирует палитру изображения единственным цветом фона (индекс 0).
+        self._pal_colors - список цветов палитры по индексам, self._pal_index - обратный словарь
+        (r, g, b) -> индекс для быстрого поиска при смене цвета кисти.
+        """
+        bg_rgb = ImageColor.getrgb(bg)
+        self._pal_colors = [bg_rgb]
+        self._pal_index = {bg_rgb: 0}
+        self._apply_palette()
+
+    def _apply_palette(self):
+        """
+        Записывает текущий список цветов self._pal_colors в палитру изображения,
+        дополняя ее нулями до полных 256 записей.
+        """
+        flat = [channel for rgb in self._pal_colors for channel in rgb]
+        flat.extend([0] * (768 - len(flat)))
+        self.image.putpalette(flat)
+
+    def _color_index(self, rgb):
+        """
+        Возвращает индекс цвета в палитре изображения, при необходимости выделяя новый.
+        Если все 256 записей заняты, возвращается индекс ближайшего (по квадрату расстояния
+        в пространстве RGB) из уже имеющихся цветов.
+        """
+        idx = self._pal_index.get(rgb)
+        if idx is not None:
+            return idx
+        if len(self._pal_colors) >= 256:
+            r, g, b = rgb
+            return min(self._pal_index.values(),
+                       key=lambda i: (self._pal_colors[i][0] - r) ** 2
+                                     + (self._pal_colors[i][1] - g) ** 2
+                                     + (self._pal_colors[i][2] - b) ** 2)
+        idx = len(self._pal_colors)
+        self._pal_colors.append(rgb)
+        self._pal_index[rgb] = idx
+        self._apply_palette()
+        return idx
+
+    def _set_pen(self, color):
+        """
+        Единая точка смены цвета кисти. Принимает цвет в любом виде, понятном Tkinter (имя или HEX).
+        Помимо self.pen_color сразу обновляет Label предпросмотра и кэширует разобранный кортеж
+        (r, g, b) в self._pen_rgb и индекс цвета в палитре изображения в self._pen_index:
+        они нужны методам, пишущим напрямую в буфер Pillow, и разбор строки с поиском по палитре
+        выполняются один раз при смене цвета, а не на каждый сегмент штриха.
+        """
+        self.pen_color = color
+        r16, g16, b16 = self.root.winfo_rgb(color)
+        self._pen_rgb = (r16 // 257, g16 // 257, b16 // 257)
+        self._pen_index = self._color_index(self._pen_rgb)
+        self.color_preview.config(bg=color)  # Обновление цвета в Label
+
     def change_background_color(self):
         """
         Метод позволяет пользователю выбрать новый цвет фона холста. По умолчанию он белый
@@ -123,47 +255,110 @@ class DrawingApp:
         """
         new_color = colorchooser.askcolor()[1]
         if new_color:
-            self.canvas.config(bg=new_color)
-            self.image = Image.new("RGB", (self.width, self.height), new_color)
-            self.draw = ImageDraw.Draw(self.image)
-            self.update_canvas()
+            self._reset_buffer(self.width, self.height, new_color)
+
+    def _ask_text_and_coords(self):
+        """
+        Открывает одно модальное окно с тремя полями ввода (текст и координаты X, Y) и кнопкой OK.
+        Раньше эти значения запрашивались тремя последовательными диалогами simpledialog,
+        каждый из которых создавал свой Toplevel и крутил собственный цикл событий.
+        Возвращает кортеж (text, x, y), либо (None, None, None), если ввод отменен или некорректен.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Добавить текст")
+        dialog.transient(self.root)
+        # Захватывать ввод можно только после отображения окна: на X11 grab_set
+        # по еще не видимому окну завершается ошибкой "grab failed: window not viewable"
+        dialog.wait_visibility()
+        dialog.grab_set()
+
+        result = {}
+
+        tk.Label(dialog, text="Текст:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
+        text_entry = tk.Entry(dialog)
+        text_entry.grid(row=0, column=1, padx=5, pady=2)
+
+        tk.Label(dialog, text="X:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+        x_entry = tk.Entry(dialog)
+        x_entry.grid(row=1, column=1, padx=5, pady=2)
+
+        tk.Label(dialog, text="Y:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+        y_entry = tk.Entry(dialog)
+        y_entry.grid(row=2, column=1, padx=5, pady=2)
+
+        def on_ok():
+            try:
+                x = int(x_entry.get())
+                y = int(y_entry.get())
+            except ValueError:
+                # Не закрываем диалог, чтобы введенный текст не пропал: пользователь
+                # может исправить координаты и нажать OK еще раз
+                messagebox.showerror("Ошибка", "Координаты X и Y должны быть целыми числами",
+                                     parent=dialog)
+                return
+            result['text'] = text_entry.get()
+            result['x'] = x
+            result['y'] = y
+            dialog.destroy()
+
+        ok_button = tk.Button(dialog, text="OK", command=on_ok)
+        ok_button.grid(row=3, column=0, columnspan=2, pady=5)
+
+        text_entry.focus_set()
+        self.root.wait_window(dialog)
+
+        if result.get('text'):
+            return result['text'], result['x'], result['y']
+        return None, None, None
 
     def add_text(self):
         """
         Метод для добавления нового текста.
-        После ввода текста необходимо выбрать координаты для того, чтобы определить его расположение
+        Текст и координаты его размещения вводятся в одном диалоговом окне (см. _ask_text_and_coords).
+        Измеренный через textbbox прямоугольник текста передается в update_canvas,
+        чтобы перерисовать только затронутую область холста, а не весь холст целиком.
         """
-        # Скрываем главное окно, чтобы диалоговое окно было на переднем плане
-        self.root.withdraw()
-
-        text = simpledialog.askstring("Введите текст", "Введите текст для добавления на холст:")
-        if text:
-            x, y = (simpledialog.askinteger("Координаты", "Введите X:"),
-                    simpledialog.askinteger("Координаты", "Введите Y:"))
-            if x is not None and y is not None:
-                self.draw.text((x, y), text, fill=self.pen_color)
-                self.update_canvas()
-
-        # Возвращаем главное окно на передний план
-        self.root.deiconify()
-
-    def update_canvas(self):
+        text, x, y = self._ask_text_and_coords()
+        if text is not None:
+            bbox = self.draw.textbbox((x, y), text)
+            self.draw.text((x, y), text, fill=self._pen_index)
+            self._refresh_pixel_access()
+            self.update_canvas(bbox=bbox)
+
+    def update_canvas(self, bbox=None):
         """
         Используется для обновления виджета Canvas, чтобы отображать изменения в изображении.
+        Если передан bbox (x0, y0, x1, y1) измененной области и она занимает меньше половины холста,
+        конвертируется только эта область: фрагмент накладывается поверх постоянного буфера self.photo
+        отдельным небольшим объектом create_image (PhotoImage.paste в актуальных версиях Pillow
+        не умеет вставлять со смещением, поэтому вписать фрагмент в self.photo напрямую нельзя).
+        Чтобы фрагменты не накапливались бесконечно, по достижении лимита весь рисунок
+        один раз вписывается в self.photo целиком, а фрагменты удаляются.
+        bbox обрезается по границам холста: штрих может частично выходить за его пределы.
         """
-        self.canvas.delete("all")
-        self.photo = ImageTk.PhotoImage(self.image)
-        self.canvas.create_image(0, 0, image=self.photo, anchor=tk.NW)
+        if bbox is not None:
+            bx0, by0 = max(bbox[0], 0), max(bbox[1], 0)
+            bx1, by1 = min(bbox[2], self.width), min(bbox[3], self.height)
+            if bx0 >= bx1 or by0 >= by1:
+                return
+            if ((bx1 - bx0) * (by1 - by0) * 2 < self.width * self.height
+                    and len(self._photo_patches) < 100):
+                patch = ImageTk.PhotoImage(self.image.crop((bx0, by0, bx1, by1)))
+                self._photo_patches.append(patch)
+                self.canvas.create_image(bx0, by0, image=patch, anchor=tk.NW, tags='patch')
+                return
+
+        self.photo.paste(self.image)
+        self.canvas.delete('patch')
+        self._photo_patches = []
 
     def change_canvas_size(self):
         """
         Метод изменяет размер холста, позволяя пользователю задать новые размеры через диалоговые окна
         new_width: новая ширина холста;
         new_height: новая высота холста;
-        self.canvas.config: настройка виджета Canvas с новыми размерами
-        self.image: новый объект изображения с заданными размерами и белым фоном
-        self.draw: обновление объекта ImageDraw для рисования на новом холсте
-        self.clear_canvas(): очистка холста, чтобы удалить предыдущие рисунки и подготовить его для новой работы.
+        self._reset_buffer: пересоздание изображения, объекта ImageDraw и настройка виджета Canvas
+        с новыми размерами и белым фоном.
         """
         # Скрываем главное окно, чтобы диалоговое окно было на переднем плане
         self.root.withdraw()
@@ -175,13 +370,7 @@ class DrawingApp:
         self.root.deiconify()
 
         if new_width and new_height:
-            self.width = new_width
-            self.height = new_height
-
-            self.canvas.config(width=self.width, height=self.height)
-            self.image = Image.new("RGB", (self.width, self.height), "white")
-            self.draw = ImageDraw.Draw(self.image)
-            self.clear_canvas()
+            self._reset_buffer(new_width, new_height, "white")
 
     def update_brush_size(self, selected_size):
         """
@@ -194,44 +383,111 @@ class DrawingApp:
         """
         self.brush_size = int(selected_size)
 
+    def _start_stroke(self, event):
+        """
+        Обработчик нажатия левой кнопки мыши: запоминает начальную точку штриха.
+        Благодаря этому paint и _flush_stroke всегда имеют корректные стартовые координаты
+        и не нуждаются в проверке "а началось ли рисование" на каждое событие движения.
+        """
+        self.last_x, self.last_y = event.x, event.y
+
     def paint(self, event):
         """
-        Вызывается при движении мыши с нажатой левой кнопкой по холсту. Она рисует линии на холсте Tkinter
-        и параллельно на объекте Image из Pillow.
-        Описание:
-        - условный оператор if: проверяем, есть ли предыдущие координаты (last_x и last_y), чтобы начать рисование линии.
-        Если они существуют, это означает, что пользователь уже начал рисовать и мы можем провести линию.
-        - вызов create_line: создает линию на виджете canvas. Параметры управления (width, fill, capstyle и smooth)
-        определяют внешний вид линии (толщину, цвет и стиль концов)
-        - self.draw.line: рисует ту же линию на объекте Image, чтобы сохранить данные для будущего сохранения в файл.
-        Это необходимо, чтобы линия отображалась не только на холсте, но и была частью изображения, которое мы можем сохранить;
-        - после рисования линии обновляем координаты last_x и last_y текущими координатами события.
-        Это позволяет продолжать рисование, используя новые координаты как начало следующей линии.
-        """
-        if self.last_x and self.last_y:
-            self.canvas.create_line(self.last_x, self.last_y, event.x, event.y,
-                                    width=self.brush_size, fill=self.pen_color,
-                                    capstyle=tk.ROUND, smooth=tk.TRUE)
-            self.draw.line([self.last_x, self.last_y, event.x, event.y], fill=self.pen_color,
-                           width=self.brush_size)
-
-        self.last_x = event.x
-        self.last_y = event.y
+        Вызывается при движении мыши с нажатой левой кнопкой по холсту.
+        События <B1-Motion> приходят с частотой устройства ввода, поэтому рисовать на каждое событие дорого.
+        Вместо этого точка добавляется в буфер self._pending_pts, а собственно рисование откладывается
+        до ближайшего простоя цикла событий через after_idle (метод _flush_stroke).
+        Флаг self._flush_scheduled гарантирует, что на один пакет точек планируется только один вызов.
+        Игровые мыши опрашиваются на 500-1000 Гц - заметно чаще, чем обновляется экран,
+        поэтому поток событий дополнительно прореживается примерно до 120 Гц:
+        точка, пришедшая слишком рано и почти совпадающая с предыдущей, отбрасывается.
+        На глаз это неотличимо, а объем работы на пиксель штриха падает кратно частоте мыши.
+        """
+        now = time.perf_counter()
+        buf = self._pending_pts
+        if (buf and now - self._last_paint_t < 1 / 120
+                and abs(event.x - buf[-2]) + abs(event.y - buf[-1]) <= 2):
+            return
+        self._last_paint_t = now
+        buf.append(event.x)
+        buf.append(event.y)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_stroke)
+
+    def _flush_stroke(self):
+        """
+        Выталкивает накопленные в self._pending_pts точки одним пакетом.
+        Линия рисуется только в буфер Pillow (self.image), после чего измененный прямоугольник
+        вписывается в постоянный PhotoImage через update_canvas - холст Tk не получает
+        ни одного собственного объекта-линии, поэтому и дублирующего рисования,
+        и накопления объектов холста нет вовсе.
+        После рисования координаты last_x и last_y обновляются последней точкой пакета,
+        чтобы следующий пакет продолжил линию с того же места.
+        Буфер хранит координаты плоским списком и очищается на месте (del coords[:]),
+        поэтому между пакетами не создаются промежуточные кортежи и новые списки.
+        """
+        self._flush_scheduled = False
+        coords = self._pending_pts
+        if not coords:
+            return
+
+        # Сравнение с None вместо проверки истинности: координата 0 - допустимая точка
+        if self.last_x is not None:
+            coords[:0] = (self.last_x, self.last_y)
+
+        bbox = None
+        if len(coords) >= 4:
+            if self.brush_size >= 5:
+                self._draw_wide_line(coords)
+            else:
+                self.draw.line(coords, fill=self._pen_index, width=self.brush_size)
+            r = self.brush_size
+            xs = coords[0::2]
+            ys = coords[1::2]
+            bbox = (min(xs) - r, min(ys) - r, max(xs) + r, max(ys) + r)
+
+        # Состояние штриха обновляется до обращения к холсту: если обновление экрана
+        # завершится ошибкой, буфер не должен остаться неочищенным и расти от пакета к пакету
+        self.last_x, self.last_y = coords[-2], coords[-1]
+        del coords[:]
+
+        if bbox is not None:
+            self.update_canvas(bbox=bbox)
+
+    def _draw_wide_line(self, coords):
+        """
+        Рисует широкую линию через маску и композитную вставку вместо прямого draw.line.
+        Для толстой кисти универсальный растеризатор Pillow обходит все пиксели ширина x длина на каждом сегменте.
+        Здесь та же линия рисуется в небольшую одноканальную маску размером с ограничивающий прямоугольник штриха,
+        после чего цвет вставляется в изображение одним вызовом Image.paste по этой маске -
+        затрагиваются только пиксели прямоугольника, и вся работа выполняется на уровне C.
+        Для тонкой кисти (менее 5 пикселей) прямой draw.line дешевле, и этот путь не используется.
+        """
+        r = self.brush_size
+        xs = coords[0::2]
+        ys = coords[1::2]
+        bx0, by0 = min(xs) - r, min(ys) - r
+        bx1, by1 = max(xs) + r, max(ys) + r
+        mask = Image.new("L", (bx1 - bx0, by1 - by0), 0)
+        local = [coord - (bx0 if i % 2 == 0 else by0) for i, coord in enumerate(coords)]
+        ImageDraw.Draw(mask).line(local, fill=255, width=self.brush_size)
+        self.image.paste(self._pen_index, (bx0, by0), mask)
 
     def reset(self, event):
         """
         Этот метод сбрасывает последние координаты кисти. Это необходимо для корректного начала новой линии после того,
         как пользователь отпустил кнопку мыши и снова начал рисовать.
+        Перед сбросом принудительно выталкиваются точки, еще остающиеся в буфере штриха.
         """
+        self._flush_stroke()
         self.last_x, self.last_y = None, None
 
     def clear_canvas(self):
         """
         Очищает холст, удаляя все нарисованное, и пересоздает объекты Image и ImageDraw для нового изображения
         """
-        self.canvas.delete("all")
-        self.image = Image.new("RGB", (self.width, self.height), "white")
-        self.draw = ImageDraw.Draw(self.image)
+        self._reset_buffer(self.width, self.height, "white")
 
     def choose_color(self, event=None):
         """
@@ -241,16 +497,14 @@ class DrawingApp:
         """
         new_color = colorchooser.askcolor(color=self.pen_color)[1]
         if new_color:
-            self.pen_color = new_color
-            self.color_preview.config(bg=self.pen_color) # Обновление цвета в Label
+            self._set_pen(new_color)
 
     def use_eraser(self):
         """
         Переключает цвет кисти на цвет фона (белый) для использования в качестве ластика.
         Сохраняем текущий цвет в переменную self.previous_color, а затем изменяем цвет кисти на белый.
         """
-        self.pen_color = 'white'
-        self.color_preview.config(bg=self.pen_color)  # Обновление цвета в Label
+        self._set_pen('white')
 
     def pick_color(self, event):
         """
@@ -260,15 +514,15 @@ class DrawingApp:
         Описание метода:
         - получаем координаты курсора (event.x, event.y);
         - проверяем, находится ли курсор в пределах холста;
-        - получаем цвета пикселя;
+        - получаем цвет пикселя через кэшированный объект доступа self._px (быстрее, чем getpixel);
         - преобразуем RGB цвет в HEX формат (рекомендовано при работе с Tkinter);
         - выводим код цвета в консоль (для отладки)
         """
         x, y = event.x, event.y
         if 0 <= x < self.width and 0 <= y < self.height:
-            color = self.image.getpixel((x, y))
-            self.pen_color = f'#{color[0]:02x}{color[1]:02x}{color[2]:02x}'
-            self.color_preview.config(bg=self.pen_color)  # Обновление цвета в Label
+            r, g, b = self._pixel_at(x, y)
+            # Один вызов форматирования с упаковкой каналов в число вместо трех f-string полей
+            self._set_pen('#%06x' % ((r << 16) | (g << 8) | b))
 
             print(f"Выбранный цвет: {self.pen_color}")
 
@@ -277,13 +531,37 @@ class DrawingApp:
         Позволяет пользователю сохранить изображение, используя стандартное диалоговое окно для сохранения файла.
         Поддерживает только формат PNG. В случае успешного сохранения выводится сообщение об успешном сохранении.
         Принимает аргумент event, необходимый для корректной работы с bind().
+        Кодирование PNG выполняется в фоновом потоке (см. _do_save), чтобы на больших холстах
+        интерфейс не замирал на время сжатия. Вместо Image.copy (выделения второго полного буфера
+        в потоке интерфейса) снимается снимок сырых байтов через tobytes - одно непрерывное
+        C-копирование, из которого рабочий поток восстанавливает изображение сам.
+        Палитра снимается вместе с байтами, поэтому пользователь может продолжать рисовать,
+        не искажая сохраняемый снимок.
         """
         file_path = filedialog.asksaveasfilename(filetypes=[('PNG files', '*.png')])
         if file_path:
             if not file_path.endswith('.png'):
                 file_path += '.png'
-            self.image.save(file_path)
-            messagebox.showinfo("Информация", "Изображение успешно сохранено!")
+            raw = self.image.tobytes()
+            palette = self.image.getpalette()
+            threading.Thread(target=self._do_save,
+                             args=(raw, self.image.mode, self.image.size, palette, file_path),
+                             daemon=True).start()
+
+    def _do_save(self, raw, mode, size, palette, file_path):
+        """
+        Выполняется в фоновом потоке: восстанавливает изображение из снимка сырых байтов и палитры,
+        разворачивает его в RGB, кодирует в PNG и записывает в файл.
+        compress_level=1 - самый быстрый уровень zlib, для рисунков от руки разница в размере файла
+        несущественна, а время сохранения сокращается в разы. Само кодирование идет на стороне C
+        и отпускает GIL, поэтому интерфейс не тормозит.
+        Сообщение об успехе показывается обратно в потоке интерфейса через root.after.
+        """
+        img = Image.frombytes(mode, size, raw)
+        if palette is not None:
+            img.putpalette(palette)
+        img.convert("RGB").save(file_path, optimize=False, compress_level=1)
+        self.root.after(0, lambda: messagebox.showinfo("Информация", "Изображение успешно сохранено!"))
 
 
 def main():